@@ -1,7 +1,6 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState } from 'react';
 import { AuthProvider, useAuth } from './context/AuthContext';
 import { AppProvider } from './context/AppContext';
-import { apiService } from './services/api';
 import EnhancedLandingPage from './components/Landing/EnhancedLandingPage';
 import ModernLoginPage from './components/Auth/ModernLoginPage';
 import SignupPage from './components/Auth/SignupPage';
@@ -21,16 +20,11 @@ import AnalyticsSection from './components/Analytics/AnalyticsSection';
 import SettingsSection from './components/Settings/SettingsSection';
 
 const AppContent: React.FC = () => {
-  const { user, isLoading, token } = useAuth();
+  const { user, isLoading } = useAuth();
   const [activeSection, setActiveSection] = useState('dashboard');
   const [sidebarOpen, setSidebarOpen] = useState(false);
   const [authView, setAuthView] = useState<'landing' | 'login' | 'signup' | 'forgot'>('landing');
 
-  // Initialize API service with token
-  useEffect(() => {
-    apiService.setToken(token);
-  }, [token]);
-
   if (isLoading) {
     return (
       <div className="min-h-screen flex items-center justify-center bg-gray-100 dark:bg-gray-900">
@@ -26,8 +26,8 @@ import {
   Zap
 } from 'lucide-react';
 
+// Dispatching only needs the role, so don't subscribe to app data until the fallback view renders
 const AnalyticsSection: React.FC = () => {
-  const { classes, students, attendanceRecords } = useApp();
   const { user } = useAuth();
 
   // Role-based analytics rendering
@@ -43,7 +43,12 @@ const AnalyticsSection: React.FC = () => {
     return <AdminAnalytics />;
   }
 
-  // Fallback to original analytics for backward compatibility
+  return <OverviewAnalytics />;
+};
+
+// Fallback to original analytics for backward compatibility
+const OverviewAnalytics: React.FC = () => {
+  const { classes, students, attendanceRecords } = useApp();
   const [selectedMetric, setSelectedMetric] = useState('overview');
   const [timeRange, setTimeRange] = useState('30d');
   const [isLoading, setIsLoading] = useState(false);
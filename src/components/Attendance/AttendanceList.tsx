@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useAuth } from '../../context/AuthContext';
 import { useApp } from '../../context/AppContext';
 import { Calendar, Clock, CheckCircle, XCircle, AlertCircle, Filter, Search, Download } from 'lucide-react';
@@ -13,13 +13,15 @@ const AttendanceList: React.FC = () => {
   const [searchTerm, setSearchTerm] = useState('');
 
   // Mock attendance data for demonstration
+  const today = new Date().toISOString().split('T')[0];
+  const yesterday = new Date(Date.now() - 86400000).toISOString().split('T')[0];
   const mockAttendanceRecords = [
     {
       id: '1',
       studentId: '3',
       classId: 'CS101',
       sessionId: 'session_1',
-      date: new Date().toISOString().split('T')[0],
+      date: today,
       time: '10:30 AM',
       status: 'present' as const,
       method: 'qr' as const
@@ -29,7 +31,7 @@ const AttendanceList: React.FC = () => {
       studentId: '4',
       classId: 'CS101',
       sessionId: 'session_1',
-      date: new Date().toISOString().split('T')[0],
+      date: today,
       time: '10:32 AM',
       status: 'late' as const,
       method: 'face' as const
@@ -39,7 +41,7 @@ const AttendanceList: React.FC = () => {
       studentId: '3',
       classId: 'CS201',
       sessionId: 'session_2',
-      date: new Date(Date.now() - 86400000).toISOString().split('T')[0],
+      date: yesterday,
       time: '2:00 PM',
       status: 'present' as const,
       method: 'qr' as const
@@ -49,7 +51,7 @@ const AttendanceList: React.FC = () => {
       studentId: '5',
       classId: 'CS101',
       sessionId: 'session_1',
-      date: new Date().toISOString().split('T')[0],
+      date: today,
       time: '-',
       status: 'absent' as const,
       method: 'manual' as const
@@ -58,9 +60,13 @@ const AttendanceList: React.FC = () => {
 
   const allRecords = attendanceRecords.length > 0 ? attendanceRecords : mockAttendanceRecords;
 
+  // Index students and classes once so each record resolves in O(1)
+  const studentsById = useMemo(() => new Map(students.map(s => [s.id, s])), [students]);
+  const classesById = useMemo(() => new Map(classes.map(c => [c.id, c])), [classes]);
+
   const filteredRecords = allRecords.filter(record => {
-    const student = students.find(s => s.id === record.studentId);
-    const classInfo = classes.find(c => c.id === record.classId);
+    const student = studentsById.get(record.studentId);
+    const classInfo = classesById.get(record.classId);
     
     const matchesDate = !filterDate || record.date === filterDate;
     const matchesClass = !filterClass || record.classId === filterClass;
@@ -73,22 +79,24 @@ const AttendanceList: React.FC = () => {
   });
 
   const exportToExcel = () => {
-    const exportData = filteredRecords.map(record => {
-      const student = students.find(s => s.id === record.studentId);
-      const classInfo = classes.find(c => c.id === record.classId);
-      
-      return {
-        'Student Name': student?.name || 'Unknown',
-        'Student ID': student?.studentId || 'N/A',
-        'Class': classInfo?.name || 'Unknown',
-        'Date': record.date,
-        'Time': record.time,
-        'Status': record.status,
-        'Method': record.method
-      };
-    });
+    // Plain row arrays with a fixed header skip json_to_sheet's per-row key scan
+    const rows: (string | undefined)[][] = [['Student Name', 'Student ID', 'Class', 'Date', 'Time', 'Status', 'Method']];
+    for (const record of filteredRecords) {
+      const student = studentsById.get(record.studentId);
+      const classInfo = classesById.get(record.classId);
+
+      rows.push([
+        student?.name || 'Unknown',
+        student?.studentId || 'N/A',
+        classInfo?.name || 'Unknown',
+        record.date,
+        record.time,
+        record.status,
+        record.method
+      ]);
+    }
 
-    const ws = XLSX.utils.json_to_sheet(exportData);
+    const ws = XLSX.utils.aoa_to_sheet(rows);
     const wb = XLSX.utils.book_new();
     XLSX.utils.book_append_sheet(wb, ws, 'Attendance Records');
     XLSX.writeFile(wb, `attendance_records_${new Date().toISOString().split('T')[0]}.xlsx`);
@@ -145,7 +153,7 @@ const AttendanceList: React.FC = () => {
             </p>
           ) : (
             studentRecords.map((record) => {
-              const classInfo = classes.find(c => c.id === record.classId);
+              const classInfo = classesById.get(record.classId);
               return (
                 <div key={record.id} className="border dark:border-gray-700 rounded-lg p-4">
                   <div className="flex justify-between items-center">
@@ -309,8 +317,8 @@ const AttendanceList: React.FC = () => {
               </tr>
             ) : (
               filteredRecords.map((record) => {
-                const student = students.find(s => s.id === record.studentId);
-                const classInfo = classes.find(c => c.id === record.classId);
+                const student = studentsById.get(record.studentId);
+                const classInfo = classesById.get(record.classId);
                 
                 return (
                   <tr key={record.id} className="hover:bg-gray-50 dark:hover:bg-gray-700">
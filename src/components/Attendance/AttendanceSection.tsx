@@ -24,20 +24,24 @@ const AttendanceSection: React.FC = () => {
 
   const startClass = async (classId: string) => {
     try {
+      // Read the clock once so the session id, QR timestamp and start time all agree
+      const now = new Date();
+      const timestamp = now.getTime();
+
       // Generate unique session ID and QR code
-      const sessionId = `session_${Date.now()}`;
+      const sessionId = `session_${timestamp}`;
       const qrData = JSON.stringify({
         sessionId,
         classId,
-        timestamp: Date.now()
+        timestamp
       });
 
       const newSession = {
         id: sessionId,
         classId,
         facultyId: user!.id,
-        date: new Date().toISOString().split('T')[0],
-        startTime: new Date().toLocaleTimeString(),
+        date: now.toISOString().split('T')[0],
+        startTime: now.toLocaleTimeString(),
         qrCode: qrData,
         isActive: true,
         attendees: []
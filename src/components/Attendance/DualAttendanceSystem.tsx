@@ -1,8 +1,9 @@
-import React, { useState, useRef, useEffect } from 'react';
+import React, { useState, useRef, useEffect, useMemo } from 'react';
 import { useAuth } from '../../context/AuthContext';
 import { useApp } from '../../context/AppContext';
 import { faceRecognitionService } from '../../services/faceRecognition';
 import { glassmorphismStyles } from '../../styles/glassmorphism';
+import { formatDateTime } from '../../utils/dateFormat';
 import {
   QrCodeIcon,
   CameraIcon,
@@ -52,6 +53,18 @@ const DualAttendanceSystem: React.FC = () => {
   const videoRef = useRef<HTMLVideoElement>(null);
   const canvasRef = useRef<HTMLCanvasElement>(null);
   const qrScannerRef = useRef<any>(null);
+  const markedRef = useRef(false);
+
+  // The detection loop re-renders every frame, so resolve the current user's latest records once per change
+  const recentUserRecords = useMemo(() => {
+    const recent: typeof attendanceRecords = [];
+    for (let i = attendanceRecords.length - 1; i >= 0 && recent.length < 5; i--) {
+      if (attendanceRecords[i].studentId === user?.id) {
+        recent.push(attendanceRecords[i]);
+      }
+    }
+    return recent;
+  }, [attendanceRecords, user?.id]);
 
   useEffect(() => {
     if (selectedMode === 'face' && showCamera) {
@@ -99,8 +112,8 @@ const DualAttendanceSystem: React.FC = () => {
           if (detections.length > 0) {
             setFaceDetected(true);
             
-            // Try to recognize the face
-            const result = await faceRecognitionService.recognizeFace(videoRef.current);
+            // Recognize from this frame's detection instead of detecting again
+            const result = faceRecognitionService.matchDetection(detections[0]);
             setRecognitionResult(result);
             
             if (result.recognized && result.userId === user?.id) {
@@ -140,6 +153,7 @@ const DualAttendanceSystem: React.FC = () => {
           {
             highlightScanRegion: true,
             highlightCodeOutline: true,
+            maxScansPerSecond: 5,
           }
         );
         
@@ -153,6 +167,13 @@ const DualAttendanceSystem: React.FC = () => {
   };
 
   const handleQRResult = (result: string) => {
+    // The scanner reports every decoded frame, so reject codes that can't be our JSON payload before parsing
+    if (!result.startsWith('{"')) {
+      setMessage('Invalid QR code format');
+      setAttendanceStatus('error');
+      return;
+    }
+
     try {
       const qrData = JSON.parse(result);
       if (qrData.classId === selectedClass && qrData.type === 'attendance') {
@@ -168,15 +189,21 @@ const DualAttendanceSystem: React.FC = () => {
   };
 
   const markAttendance = async (method: 'qr' | 'face', confidence: number) => {
+    // Scanner and detection callbacks keep firing after a successful mark; record once per scan
+    if (markedRef.current) return;
+    markedRef.current = true;
+
     try {
+      // Share one clock read between the record id and its timestamp
+      const now = new Date();
       const attendanceRecord = {
-        id: Date.now().toString(),
+        id: now.getTime().toString(),
         studentId: user?.id || '',
         studentName: user?.name || '',
         classId: selectedClass,
         method,
         confidence,
-        timestamp: new Date().toISOString(),
+        timestamp: now.toISOString(),
         photo: method === 'face' ? await capturePhoto() : null
       };
 
@@ -196,24 +223,34 @@ const DualAttendanceSystem: React.FC = () => {
       console.error('Error marking attendance:', error);
       setMessage('Failed to mark attendance');
       setAttendanceStatus('error');
+      markedRef.current = false;
     }
   };
 
-  const capturePhoto = async (): Promise<string> => {
-    if (videoRef.current && canvasRef.current) {
-      const canvas = canvasRef.current;
+  const capturePhoto = (): Promise<Blob | null> => {
+    return new Promise(resolve => {
       const video = videoRef.current;
-      
+      if (!video) {
+        resolve(null);
+        return;
+      }
+
+      // Use a scratch canvas so the detection overlay isn't resized or overwritten
+      const canvas = document.createElement('canvas');
       canvas.width = video.videoWidth;
       canvas.height = video.videoHeight;
-      
+
       const ctx = canvas.getContext('2d');
-      if (ctx) {
-        ctx.drawImage(video, 0, 0);
-        return canvas.toDataURL('image/jpeg', 0.8);
+      if (!ctx) {
+        resolve(null);
+        return;
       }
-    }
-    return '';
+
+      ctx.drawImage(video, 0, 0);
+      // Encode asynchronously into a binary Blob rather than a base64 data URL string a third larger.
+      // Keep the Blob itself; an object URL would pin it for the life of the page and nothing renders it
+      canvas.toBlob(blob => resolve(blob), 'image/jpeg', 0.8);
+    });
   };
 
   const startScanning = async () => {
@@ -223,6 +260,7 @@ const DualAttendanceSystem: React.FC = () => {
       return;
     }
 
+    markedRef.current = false;
     setIsScanning(true);
     setAttendanceStatus('idle');
     setMessage('');
@@ -454,11 +492,7 @@ const DualAttendanceSystem: React.FC = () => {
           </h3>
           
           <div className="space-y-3">
-            {attendanceRecords
-              .filter(record => record.studentId === user?.id)
-              .slice(-5)
-              .reverse()
-              .map((record) => (
+            {recentUserRecords.map((record) => (
                 <div key={record.id} className="flex items-center justify-between p-3 bg-white/20 dark:bg-gray-800/20 rounded-xl">
                   <div className="flex items-center space-x-3">
                     <div className={`p-2 rounded-lg ${
@@ -477,7 +511,7 @@ const DualAttendanceSystem: React.FC = () => {
                         {record.classId}
                       </p>
                       <p className="text-sm text-gray-600 dark:text-gray-300">
-                        {new Date(record.timestamp).toLocaleString()}
+                        {formatDateTime(record.timestamp)}
                       </p>
                     </div>
                   </div>
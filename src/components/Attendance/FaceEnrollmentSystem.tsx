@@ -34,7 +34,6 @@ const FaceEnrollmentSystem: React.FC = () => {
 
   const videoRef = useRef<HTMLVideoElement>(null);
   const canvasRef = useRef<HTMLCanvasElement>(null);
-  const photoCanvasRef = useRef<HTMLCanvasElement>(null);
 
   const enrollmentSteps: EnrollmentStep[] = [
     {
@@ -104,7 +103,8 @@ const FaceEnrollmentSystem: React.FC = () => {
     const detectFaces = async () => {
       if (videoRef.current && canvasRef.current) {
         try {
-          const detections = await faceRecognitionService.detectFaces(videoRef.current);
+          // The preview only needs to know a face is in frame, so detect at a reduced input size
+          const detections = await faceRecognitionService.detectFaces(videoRef.current, 320);
           
           if (detections.length > 0) {
             setFaceDetected(true);
@@ -134,9 +134,10 @@ const FaceEnrollmentSystem: React.FC = () => {
     detectFaces();
   };
 
-  const capturePhoto = async (): Promise<string> => {
-    if (videoRef.current && photoCanvasRef.current) {
-      const canvas = photoCanvasRef.current;
+  // Keep each frame as its own canvas so detection reads raw pixels instead of a re-decoded JPEG
+  const capturePhoto = (): HTMLCanvasElement | null => {
+    if (videoRef.current) {
+      const canvas = document.createElement('canvas');
       const video = videoRef.current;
       
       canvas.width = video.videoWidth;
@@ -145,10 +146,10 @@ const FaceEnrollmentSystem: React.FC = () => {
       const ctx = canvas.getContext('2d');
       if (ctx) {
         ctx.drawImage(video, 0, 0);
-        return canvas.toDataURL('image/jpeg', 0.8);
+        return canvas;
       }
     }
-    return '';
+    return null;
   };
 
   const enrollFace = async () => {
@@ -164,20 +165,21 @@ const FaceEnrollmentSystem: React.FC = () => {
 
     try {
       // Capture multiple photos for better recognition
-      const photos: string[] = [];
+      const frames: HTMLCanvasElement[] = [];
       for (let i = 0; i < 5; i++) {
-        const photo = await capturePhoto();
-        photos.push(photo);
+        const frame = capturePhoto();
+        if (frame) {
+          frames.push(frame);
+        }
         setEnrollmentProgress((i + 1) * 20);
         await new Promise(resolve => setTimeout(resolve, 500));
       }
 
-      setCapturedPhotos(photos);
+      // Data URLs are only needed for the preview thumbnails
+      setCapturedPhotos(frames.map(frame => frame.toDataURL('image/jpeg', 0.8)));
 
-      // Enroll face using the first photo
-      if (videoRef.current) {
-        await faceRecognitionService.enrollFace(videoRef.current, user?.id || '');
-      }
+      // Enroll all captured angles in a single batch
+      await faceRecognitionService.enrollFaces(frames, user?.id || '');
 
       setEnrollmentSteps(prev => prev.map(step => 
         step.id === 3 ? { ...step, completed: true } : step
@@ -442,12 +444,6 @@ const FaceEnrollmentSystem: React.FC = () => {
             </button>
           </div>
         )}
-
-        {/* Hidden canvas for photo capture */}
-        <canvas
-          ref={photoCanvasRef}
-          className="hidden"
-        />
       </div>
     </div>
   );
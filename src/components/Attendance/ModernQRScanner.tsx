@@ -19,16 +19,20 @@ const ModernQRScanner: React.FC<ModernQRScannerProps> = ({ onScanSuccess, onClos
   const [isScanning, setIsScanning] = useState(false);
   const [error, setError] = useState('');
   const [scanResult, setScanResult] = useState<string | null>(null);
+  // Read the latest callback through a ref so a new parent closure doesn't rebuild the scanner
+  const onScanSuccessRef = useRef(onScanSuccess);
+  onScanSuccessRef.current = onScanSuccess;
 
   useEffect(() => {
     if (videoRef.current) {
       const scanner = new QrScanner(
         videoRef.current,
         (result) => {
-          console.log('QR Code detected:', result);
+          // Fires on every decoded frame, so keep the log out of production builds
+          if (import.meta.env.DEV) console.log('QR Code detected:', result);
           setScanResult(result.data);
           setTimeout(() => {
-            onScanSuccess(result.data);
+            onScanSuccessRef.current(result.data);
             scanner.stop();
           }, 1500);
         },
@@ -56,7 +60,7 @@ const ModernQRScanner: React.FC<ModernQRScannerProps> = ({ onScanSuccess, onClos
         scanner.destroy();
       };
     }
-  }, [onScanSuccess]);
+  }, []);
 
   const handleClose = () => {
     if (qrScanner) {
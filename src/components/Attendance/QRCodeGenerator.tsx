@@ -1,5 +1,5 @@
 import React, { useEffect, useRef } from 'react';
-import QRCode from 'qrcode';
+import { renderQRCode } from '../../utils/qrCode';
 
 interface QRCodeGeneratorProps {
   data: string;
@@ -11,18 +11,7 @@ const QRCodeGenerator: React.FC<QRCodeGeneratorProps> = ({ data, size = 200 }) =
 
   useEffect(() => {
     if (canvasRef.current && data) {
-      QRCode.toCanvas(canvasRef.current, data, {
-        width: size,
-        margin: 2,
-        color: {
-          dark: '#000000',
-          light: '#FFFFFF'
-        }
-      }, (error) => {
-        if (error) {
-          console.error('QR Code generation failed:', error);
-        }
-      });
+      renderQRCode(canvasRef.current, data, size);
     }
   }, [data, size]);
 
@@ -18,7 +18,8 @@ const QRCodeScanner: React.FC<QRCodeScannerProps> = ({ onScanSuccess, onClose })
       const scanner = new QrScanner(
         videoRef.current,
         (result) => {
-          console.log('QR Code detected:', result);
+          // Fires on every decoded frame, so keep the log out of production builds
+          if (import.meta.env.DEV) console.log('QR Code detected:', result);
           onScanSuccess(result.data);
           scanner.stop();
         },
@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { UserCheck, Mail, ArrowLeft, CheckCircle } from 'lucide-react';
+import { isValidEmail } from '../../utils/validators';
 
 interface ForgotPasswordPageProps {
   onBackToLogin: () => void;
@@ -21,7 +22,7 @@ const ForgotPasswordPage: React.FC<ForgotPasswordPageProps> = ({ onBackToLogin,
       return;
     }
     
-    if (!/\S+@\S+\.\S+/.test(email)) {
+    if (!isValidEmail(email)) {
       setError('Please enter a valid email address');
       return;
     }
@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useAuth } from '../../context/AuthContext';
 import { useApp } from '../../context/AppContext';
+import { isValidEmail } from '../../utils/validators';
 import { 
   EnvelopeIcon, 
   LockClosedIcon, 
@@ -22,6 +23,14 @@ interface ModernLoginPageProps {
   onBackToLanding: () => void;
 }
 
+// Spread the particles with a golden-ratio sequence so they stay put across re-renders
+const floatingParticles = Array.from({ length: 6 }, (_, i) => ({
+  left: `${((i * 0.618 + 0.1) % 1) * 100}%`,
+  top: `${((i * 0.382 + 0.2) % 1) * 100}%`,
+  animationDelay: `${(i * 0.5) % 3}s`,
+  animationDuration: `${3 + ((i * 0.618) % 1) * 2}s`
+}));
+
 const ModernLoginPage: React.FC<ModernLoginPageProps> = ({ 
   onSignupClick, 
   onForgotPasswordClick, 
@@ -75,12 +84,12 @@ const ModernLoginPage: React.FC<ModernLoginPageProps> = ({
     }
   ];
 
-  // Real-time validation
+  // Real-time validation, re-run only when a validated field changes (not on role selection)
   useEffect(() => {
     const errors: {[key: string]: string} = {};
     
     // Email validation
-    if (formData.email && !/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(formData.email)) {
+    if (formData.email && !isValidEmail(formData.email)) {
       errors.email = 'Please enter a valid email address';
     }
     
@@ -91,7 +100,7 @@ const ModernLoginPage: React.FC<ModernLoginPageProps> = ({
     
     setValidationErrors(errors);
     setIsFormValid(!!(formData.email && formData.password && Object.keys(errors).length === 0));
-  }, [formData]);
+  }, [formData.email, formData.password]);
 
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault();
@@ -134,16 +143,11 @@ const ModernLoginPage: React.FC<ModernLoginPageProps> = ({
       
       {/* Floating particles */}
       <div className="absolute inset-0">
-        {[...Array(6)].map((_, i) => (
+        {floatingParticles.map((particle, i) => (
           <div
             key={i}
             className="absolute w-2 h-2 bg-indigo-400/30 dark:bg-indigo-300/40 rounded-full animate-float"
-            style={{
-              left: `${Math.random() * 100}%`,
-              top: `${Math.random() * 100}%`,
-              animationDelay: `${Math.random() * 3}s`,
-              animationDuration: `${3 + Math.random() * 2}s`
-            }}
+            style={particle}
           />
         ))}
       </div>
@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
 import { UserCheck, Mail, Lock, User, Building, ArrowLeft } from 'lucide-react';
+import { isValidEmail } from '../../utils/validators';
 
 interface SignupPageProps {
   onLoginClick: () => void;
@@ -24,7 +25,7 @@ const SignupPage: React.FC<SignupPageProps> = ({ onLoginClick, onBackToLanding }
 
     if (!formData.name.trim()) newErrors.name = 'Name is required';
     if (!formData.email.trim()) newErrors.email = 'Email is required';
-    else if (!/\S+@\S+\.\S+/.test(formData.email)) newErrors.email = 'Email is invalid';
+    else if (!isValidEmail(formData.email)) newErrors.email = 'Email is invalid';
     
     if (!formData.password) newErrors.password = 'Password is required';
     else if (formData.password.length < 8) newErrors.password = 'Password must be at least 8 characters';
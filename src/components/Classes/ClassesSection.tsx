@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useAuth } from '../../context/AuthContext';
 import { useApp } from '../../context/AppContext';
 import { Plus, Edit, Trash2, Users, Calendar, MapPin, Clock, Upload } from 'lucide-react';
@@ -21,12 +21,20 @@ const ClassesSection: React.FC = () => {
     semester: ''
   });
 
+  // Resolve role permissions once instead of re-checking in every handler
+  const isAdmin = user?.role === 'admin';
+  const isFaculty = user?.role === 'faculty';
+  const canManageClasses = isAdmin || isFaculty;
+
+  // Index faculty once so each class resolves its teacher in O(1)
+  const facultyById = useMemo(() => new Map(faculty.map(f => [f.id, f])), [faculty]);
+
   const handleAddClass = () => {
-    if (user?.role === 'admin' || user?.role === 'faculty') {
+    if (canManageClasses) {
       const newClass = {
         id: `CLS${Date.now()}`,
         ...formData,
-        facultyId: user.role === 'faculty' ? user.id : formData.facultyId,
+        facultyId: isFaculty ? user!.id : formData.facultyId,
         studentIds: []
       };
       setClasses([...classes, newClass]);
@@ -43,7 +51,7 @@ const ClassesSection: React.FC = () => {
   };
 
   const handleEditClass = () => {
-    if (selectedClass && (user?.role === 'admin' || user?.role === 'faculty')) {
+    if (selectedClass && canManageClasses) {
       const updatedClasses = classes.map(cls => 
         cls.id === selectedClass.id 
           ? { ...cls, ...formData }
@@ -64,7 +72,7 @@ const ClassesSection: React.FC = () => {
   };
 
   const handleDeleteClass = (classId: string) => {
-    if (user?.role === 'admin') {
+    if (isAdmin) {
       const updatedClasses = classes.filter(cls => cls.id !== classId);
       setClasses(updatedClasses);
     }
@@ -90,14 +98,19 @@ const ClassesSection: React.FC = () => {
     Papa.parse(file, {
       complete: (result) => {
         const csvData = result.data as any[];
-        const headers = csvData[0];
+        // skipEmptyLines leaves no header row for an empty file
+        if (csvData.length === 0) return;
+
+        // Normalise the header keys once rather than for every row
+        const keys = (csvData[0] as string[]).map(header => header.toLowerCase().replace(' ', ''));
+        const batchId = Date.now();
         const newClasses = csvData.slice(1).map((row: any[], index: number) => {
           const classData: any = {};
-          headers.forEach((header: string, headerIndex: number) => {
-            classData[header.toLowerCase().replace(' ', '')] = row[headerIndex];
+          keys.forEach((key, keyIndex) => {
+            classData[key] = row[keyIndex];
           });
           return {
-            id: `CSV${Date.now()}${index}`,
+            id: `CSV${batchId}${index}`,
             name: classData.name || '',
             subject: classData.subject || '',
             facultyId: classData.facultyid || classData.faculty || '',
@@ -118,7 +131,7 @@ const ClassesSection: React.FC = () => {
 
   const exportToExcel = () => {
     const exportData = classes.map(cls => {
-      const facultyMember = faculty.find(f => f.id === cls.facultyId);
+      const facultyMember = facultyById.get(cls.facultyId);
       return {
         'Class ID': cls.id,
         'Class Name': cls.name,
@@ -137,8 +150,8 @@ const ClassesSection: React.FC = () => {
     XLSX.writeFile(wb, `classes_${new Date().toISOString().split('T')[0]}.xlsx`);
   };
 
-  const filteredClasses = user?.role === 'faculty' 
-    ? classes.filter(cls => cls.facultyId === user.id)
+  const filteredClasses = isFaculty
+    ? classes.filter(cls => cls.facultyId === user?.id)
     : classes;
 
   return (
@@ -159,7 +172,7 @@ const ClassesSection: React.FC = () => {
           >
             Export Excel
           </button>
-          {(user?.role === 'admin' || user?.role === 'faculty') && (
+          {canManageClasses && (
             <button
               onClick={() => setShowAddModal(true)}
               className="flex items-center px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 transition-colors duration-200"
@@ -173,7 +186,7 @@ const ClassesSection: React.FC = () => {
 
       <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
         {filteredClasses.map((cls) => {
-          const facultyMember = faculty.find(f => f.id === cls.facultyId);
+          const facultyMember = facultyById.get(cls.facultyId);
           
           return (
             <div key={cls.id} className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6">
@@ -181,7 +194,7 @@ const ClassesSection: React.FC = () => {
                 <h3 className="text-lg font-semibold text-gray-900 dark:text-white">
                   {cls.name}
                 </h3>
-                {(user?.role === 'admin' || (user?.role === 'faculty' && cls.facultyId === user.id)) && (
+                {(isAdmin || (isFaculty && cls.facultyId === user?.id)) && (
                   <div className="flex space-x-2">
                     <button
                       onClick={() => openEditModal(cls)}
@@ -189,7 +202,7 @@ const ClassesSection: React.FC = () => {
                     >
                       <Edit className="h-4 w-4" />
                     </button>
-                    {user?.role === 'admin' && (
+                    {isAdmin && (
                       <button
                         onClick={() => handleDeleteClass(cls.id)}
                         className="text-red-600 hover:text-red-900 dark:text-red-400 dark:hover:text-red-300"
@@ -256,7 +269,7 @@ const ClassesSection: React.FC = () => {
                   className="w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 dark:bg-gray-700 dark:text-white"
                 />
               </div>
-              {user?.role === 'admin' && (
+              {isAdmin && (
                 <div>
                   <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">
                     Faculty
@@ -356,7 +369,7 @@ const ClassesSection: React.FC = () => {
                   className="w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 dark:bg-gray-700 dark:text-white"
                 />
               </div>
-              {user?.role === 'admin' && (
+              {isAdmin && (
                 <div>
                   <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-1">
                     Faculty
@@ -19,15 +19,17 @@ const Dashboard: React.FC<DashboardProps> = ({ setActiveSection }) => {
   const { user } = useAuth();
   const { students, classes, attendanceRecords, activeSession } = useApp();
 
-  const getTodayAttendance = () => {
-    const today = new Date().toISOString().split('T')[0];
-    return attendanceRecords.filter(record => record.date === today);
-  };
-
   const getAttendanceStats = () => {
     const totalStudents = students.length;
-    const todayAttendance = getTodayAttendance();
-    const presentToday = todayAttendance.filter(record => record.status === 'present').length;
+    const today = new Date().toISOString().split('T')[0];
+
+    // Count matches directly instead of materializing filtered lists just for their length
+    let presentToday = 0;
+    for (const record of attendanceRecords) {
+      if (record.date === today && record.status === 'present') {
+        presentToday++;
+      }
+    }
     const attendanceRate = totalStudents > 0 ? (presentToday / totalStudents) * 100 : 0;
     
     return {
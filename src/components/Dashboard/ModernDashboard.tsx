@@ -22,6 +22,38 @@ interface ModernDashboardProps {
   setActiveSection: (section: string) => void;
 }
 
+// Static dashboard content, built once at module load rather than on every render
+const aiInsights = [
+  {
+    title: 'Predicted Absentees Today',
+    value: '12 students',
+    description: 'Based on historical patterns',
+    icon: SparklesIcon,
+    color: 'text-orange-600'
+  },
+  {
+    title: 'Attendance Trend',
+    value: 'Improving',
+    description: '+5% from last week',
+    icon: ArrowTrendingUpIcon,
+    color: 'text-green-600'
+  },
+  {
+    title: 'Peak Attendance Time',
+    value: '10:00 AM',
+    description: 'Optimal class scheduling',
+    icon: ClockIcon,
+    color: 'text-blue-600'
+  }
+];
+
+const recentActivity = [
+  { student: 'John Smith', class: 'CS101', time: '10:30 AM', status: 'present' },
+  { student: 'Alice Johnson', class: 'MATH201', time: '10:28 AM', status: 'present' },
+  { student: 'Bob Wilson', class: 'PHY101', time: '10:25 AM', status: 'late' },
+  { student: 'Carol Davis', class: 'CS101', time: '10:22 AM', status: 'present' }
+];
+
 const ModernDashboard: React.FC<ModernDashboardProps> = ({ setActiveSection }) => {
   const { user } = useAuth();
   const { students, classes } = useApp();
@@ -102,37 +134,6 @@ const ModernDashboard: React.FC<ModernDashboardProps> = ({ setActiveSection }) =
     }
   ];
 
-  const aiInsights = [
-    {
-      title: 'Predicted Absentees Today',
-      value: '12 students',
-      description: 'Based on historical patterns',
-      icon: SparklesIcon,
-      color: 'text-orange-600'
-    },
-    {
-      title: 'Attendance Trend',
-      value: 'Improving',
-      description: '+5% from last week',
-      icon: ArrowTrendingUpIcon,
-      color: 'text-green-600'
-    },
-    {
-      title: 'Peak Attendance Time',
-      value: '10:00 AM',
-      description: 'Optimal class scheduling',
-      icon: ClockIcon,
-      color: 'text-blue-600'
-    }
-  ];
-
-  const recentActivity = [
-    { student: 'John Smith', class: 'CS101', time: '10:30 AM', status: 'present' },
-    { student: 'Alice Johnson', class: 'MATH201', time: '10:28 AM', status: 'present' },
-    { student: 'Bob Wilson', class: 'PHY101', time: '10:25 AM', status: 'late' },
-    { student: 'Carol Davis', class: 'CS101', time: '10:22 AM', status: 'present' }
-  ];
-
   if (loading) {
     return (
       <div className="flex items-center justify-center min-h-96">
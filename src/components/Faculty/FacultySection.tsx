@@ -1,10 +1,13 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useAuth } from '../../context/AuthContext';
 import { useApp } from '../../context/AppContext';
 import { Plus, Edit, Trash2, User, Mail, BookOpen, Building, Upload, Download } from 'lucide-react';
 import * as XLSX from 'xlsx';
 import Papa from 'papaparse';
 
+// Render the faculty grid a page at a time so large directories don't mount every card up front
+const FACULTY_PAGE_SIZE = 24;
+
 const FacultySection: React.FC = () => {
   const { user } = useAuth();
   const { faculty, setFaculty, classes } = useApp();
@@ -14,6 +17,7 @@ const FacultySection: React.FC = () => {
   const [showImportModal, setShowImportModal] = useState(false);
   const [selectedFaculty, setSelectedFaculty] = useState<any>(null);
   const [searchTerm, setSearchTerm] = useState('');
+  const [visibleCount, setVisibleCount] = useState(FACULTY_PAGE_SIZE);
   const [formData, setFormData] = useState({
     name: '',
     email: '',
@@ -22,8 +26,14 @@ const FacultySection: React.FC = () => {
     assignedClasses: []
   });
 
+  // Resolve the admin permission once instead of re-checking in every handler and card
+  const isAdmin = user?.role === 'admin';
+
+  // Index classes once so profile and export lookups don't rescan the list
+  const classesById = useMemo(() => new Map(classes.map(cls => [cls.id, cls])), [classes]);
+
   const handleAddFaculty = () => {
-    if (user?.role === 'admin') {
+    if (isAdmin) {
       const newFaculty = {
         id: `FAC${Date.now()}`,
         ...formData,
@@ -36,7 +46,7 @@ const FacultySection: React.FC = () => {
   };
 
   const handleEditFaculty = () => {
-    if (selectedFaculty && user?.role === 'admin') {
+    if (selectedFaculty && isAdmin) {
       const updatedFaculty = faculty.map(f => 
         f.id === selectedFaculty.id 
           ? { ...f, ...formData }
@@ -50,7 +60,7 @@ const FacultySection: React.FC = () => {
   };
 
   const handleDeleteFaculty = (facultyId: string) => {
-    if (user?.role === 'admin') {
+    if (isAdmin) {
       const updatedFaculty = faculty.filter(f => f.id !== facultyId);
       setFaculty(updatedFaculty);
     }
@@ -80,14 +90,19 @@ const FacultySection: React.FC = () => {
     Papa.parse(file, {
       complete: (result) => {
         const csvData = result.data as any[];
-        const headers = csvData[0];
+        // skipEmptyLines leaves no header row for an empty file
+        if (csvData.length === 0) return;
+
+        // Normalise the header keys once rather than for every row
+        const keys = (csvData[0] as string[]).map(header => header.toLowerCase().replace(' ', ''));
+        const batchId = Date.now();
         const newFaculty = csvData.slice(1).map((row: any[], index: number) => {
           const facultyData: any = {};
-          headers.forEach((header: string, headerIndex: number) => {
-            facultyData[header.toLowerCase().replace(' ', '')] = row[headerIndex];
+          keys.forEach((key, keyIndex) => {
+            facultyData[key] = row[keyIndex];
           });
           return {
-            id: `CSV${Date.now()}${index}`,
+            id: `CSV${batchId}${index}`,
             name: facultyData.name || '',
             email: facultyData.email || '',
             facultyId: facultyData.facultyid || facultyData.id || '',
@@ -111,7 +126,7 @@ const FacultySection: React.FC = () => {
       'Name': f.name,
       'Email': f.email,
       'Department': f.department,
-      'Assigned Classes': f.assignedClasses.map(id => classes.find(c => c.id === id)?.name || id).join(', ')
+      'Assigned Classes': f.assignedClasses.map(id => classesById.get(id)?.name || id).join(', ')
     }));
 
     const ws = XLSX.utils.json_to_sheet(exportData);
@@ -120,19 +135,24 @@ const FacultySection: React.FC = () => {
     XLSX.writeFile(wb, `faculty_${new Date().toISOString().split('T')[0]}.xlsx`);
   };
 
-  const filteredFaculty = faculty.filter(f =>
-    f.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    f.email.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    f.facultyId.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    f.department.toLowerCase().includes(searchTerm.toLowerCase())
-  );
+  // Lowercase the searchable fields once per faculty change rather than on every keystroke
+  const facultySearchIndex = useMemo(() => faculty.map(f => ({
+    member: f,
+    haystack: `${f.name}\n${f.email}\n${f.facultyId}\n${f.department}`.toLowerCase()
+  })), [faculty]);
+
+  const filteredFaculty = useMemo(() => {
+    const term = searchTerm.toLowerCase();
+    if (!term) return faculty;
+    return facultySearchIndex.filter(entry => entry.haystack.includes(term)).map(entry => entry.member);
+  }, [faculty, facultySearchIndex, searchTerm]);
 
   return (
     <div className="space-y-6">
       <div className="flex justify-between items-center">
         <h2 className="text-2xl font-bold text-gray-900 dark:text-white">Faculty</h2>
         <div className="flex space-x-2">
-          {user?.role === 'admin' && (
+          {isAdmin && (
             <>
               <button
                 onClick={() => setShowImportModal(true)}
@@ -165,13 +185,16 @@ const FacultySection: React.FC = () => {
           type="text"
           placeholder="Search faculty..."
           value={searchTerm}
-          onChange={(e) => setSearchTerm(e.target.value)}
+          onChange={(e) => {
+            setSearchTerm(e.target.value);
+            setVisibleCount(FACULTY_PAGE_SIZE);
+          }}
           className="w-full px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 dark:bg-gray-700 dark:text-white"
         />
       </div>
 
       <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-        {filteredFaculty.map((facultyMember) => (
+        {filteredFaculty.slice(0, visibleCount).map((facultyMember) => (
           <div key={facultyMember.id} className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6">
             <div className="flex justify-between items-start mb-4">
               <div className="flex items-center">
@@ -185,7 +208,7 @@ const FacultySection: React.FC = () => {
                   </p>
                 </div>
               </div>
-              {user?.role === 'admin' && (
+              {isAdmin && (
                 <div className="flex space-x-2">
                   <button
                     onClick={() => openEditModal(facultyMember)}
@@ -228,6 +251,17 @@ const FacultySection: React.FC = () => {
         ))}
       </div>
 
+      {filteredFaculty.length > visibleCount && (
+        <div className="flex justify-center">
+          <button
+            onClick={() => setVisibleCount(visibleCount + FACULTY_PAGE_SIZE)}
+            className="px-4 py-2 border border-gray-300 dark:border-gray-600 text-gray-700 dark:text-gray-300 rounded-md hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors duration-200"
+          >
+            Load more ({filteredFaculty.length - visibleCount} remaining)
+          </button>
+        </div>
+      )}
+
       {/* Add Faculty Modal */}
       {showAddModal && (
         <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
@@ -391,7 +425,7 @@ const FacultySection: React.FC = () => {
                 <h4 className="font-medium text-gray-900 dark:text-white mb-3">Assigned Classes</h4>
                 <div className="space-y-2">
                   {selectedFaculty.assignedClasses.map((classId: string) => {
-                    const classInfo = classes.find(c => c.id === classId);
+                    const classInfo = classesById.get(classId);
                     return (
                       <div key={classId} className="p-2 bg-gray-50 dark:bg-gray-700 rounded">
                         <p className="font-medium">{classInfo?.name || 'Unknown Class'}</p>
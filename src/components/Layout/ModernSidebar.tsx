@@ -16,6 +16,25 @@ import {
   PresentationChartBarIcon,
 } from "@heroicons/react/24/outline";
 
+const navigationItems = [
+  { id: "dashboard", label: "Dashboard", icon: HomeIcon, roles: ["student", "faculty", "admin"] },
+  { id: "attendance", label: "Attendance", icon: UserCheckIcon, roles: ["student", "faculty", "admin"] },
+  { id: "dual-attendance", label: "Smart Attendance", icon: CameraIcon, roles: ["student"] },
+  { id: "face-enrollment", label: "Face Enrollment", icon: CameraIcon, roles: ["student"] },
+  { id: "teacher-dashboard", label: "Teacher Dashboard", icon: AcademicCapIcon, roles: ["faculty"] },
+  { id: "classes", label: "Classes", icon: CalendarIcon, roles: ["faculty", "admin"] },
+  { id: "students", label: "Students", icon: UserGroupIcon, roles: ["faculty", "admin"] },
+  { id: "faculty", label: "Faculty", icon: AcademicCapIcon, roles: ["admin"] },
+  { id: "reports", label: "Reports", icon: DocumentTextIcon, roles: ["faculty", "admin"] },
+  { id: "analytics", label: "Analytics", icon: ChartBarIcon, roles: ["student", "faculty", "admin"] },
+  { id: "settings", label: "Settings", icon: CogIcon, roles: ["student", "faculty", "admin"] },
+];
+
+// Resolve each role's menu once at load instead of filtering on every render
+const navigationItemsByRole = new Map<string, typeof navigationItems>(
+  ["student", "faculty", "admin"].map((role) => [role, navigationItems.filter((item) => item.roles.includes(role))])
+);
+
 interface ModernSidebarProps {
   sidebarOpen: boolean;
   setSidebarOpen: (open: boolean) => void;
@@ -40,23 +59,7 @@ const ModernSidebar: React.FC<ModernSidebarProps> = ({
 
   const currentGradient = roleGradients[user?.role as keyof typeof roleGradients] || roleGradients.admin;
 
-  const navigationItems = [
-    { id: "dashboard", label: "Dashboard", icon: HomeIcon, roles: ["student", "faculty", "admin"] },
-    { id: "attendance", label: "Attendance", icon: UserCheckIcon, roles: ["student", "faculty", "admin"] },
-    { id: "dual-attendance", label: "Smart Attendance", icon: CameraIcon, roles: ["student"] },
-    { id: "face-enrollment", label: "Face Enrollment", icon: CameraIcon, roles: ["student"] },
-    { id: "teacher-dashboard", label: "Teacher Dashboard", icon: AcademicCapIcon, roles: ["faculty"] },
-    { id: "classes", label: "Classes", icon: CalendarIcon, roles: ["faculty", "admin"] },
-    { id: "students", label: "Students", icon: UserGroupIcon, roles: ["faculty", "admin"] },
-    { id: "faculty", label: "Faculty", icon: AcademicCapIcon, roles: ["admin"] },
-    { id: "reports", label: "Reports", icon: DocumentTextIcon, roles: ["faculty", "admin"] },
-    { id: "analytics", label: "Analytics", icon: ChartBarIcon, roles: ["student", "faculty", "admin"] },
-    { id: "settings", label: "Settings", icon: CogIcon, roles: ["student", "faculty", "admin"] },
-  ];
-
-  const filteredItems = navigationItems.filter(
-    (item) => user && item.roles.includes(user.role)
-  );
+  const filteredItems = (user && navigationItemsByRole.get(user.role)) || [];
 
   // Generate initials safely
   const getInitials = (name?: string) => {
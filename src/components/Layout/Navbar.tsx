@@ -17,6 +17,21 @@ import {
   X
 } from 'lucide-react';
 
+const navigationItems = [
+  { id: 'dashboard', label: 'Dashboard', icon: Home, roles: ['student', 'faculty', 'admin'] },
+  { id: 'attendance', label: 'Attendance', icon: UserCheck, roles: ['student', 'faculty', 'admin'] },
+  { id: 'classes', label: 'Classes', icon: Calendar, roles: ['faculty', 'admin'] },
+  { id: 'students', label: 'Students', icon: Users, roles: ['faculty', 'admin'] },
+  { id: 'faculty', label: 'Faculty', icon: GraduationCap, roles: ['admin'] },
+  { id: 'reports', label: 'Reports', icon: BarChart3, roles: ['faculty', 'admin'] },
+  { id: 'settings', label: 'Settings', icon: Settings, roles: ['student', 'faculty', 'admin'] }
+];
+
+// Resolve each role's menu once at load instead of filtering on every render
+const navigationItemsByRole = new Map<string, typeof navigationItems>(
+  ['student', 'faculty', 'admin'].map((role) => [role, navigationItems.filter((item) => item.roles.includes(role))])
+);
+
 interface NavbarProps {
   activeSection: string;
   setActiveSection: (section: string) => void;
@@ -27,19 +42,7 @@ const Navbar: React.FC<NavbarProps> = ({ activeSection, setActiveSection }) => {
   const { darkMode, toggleDarkMode } = useApp();
   const [menuOpen, setMenuOpen] = useState(false);
 
-  const navigationItems = [
-    { id: 'dashboard', label: 'Dashboard', icon: Home, roles: ['student', 'faculty', 'admin'] },
-    { id: 'attendance', label: 'Attendance', icon: UserCheck, roles: ['student', 'faculty', 'admin'] },
-    { id: 'classes', label: 'Classes', icon: Calendar, roles: ['faculty', 'admin'] },
-    { id: 'students', label: 'Students', icon: Users, roles: ['faculty', 'admin'] },
-    { id: 'faculty', label: 'Faculty', icon: GraduationCap, roles: ['admin'] },
-    { id: 'reports', label: 'Reports', icon: BarChart3, roles: ['faculty', 'admin'] },
-    { id: 'settings', label: 'Settings', icon: Settings, roles: ['student', 'faculty', 'admin'] }
-  ];
-
-  const filteredItems = navigationItems.filter(item => 
-    user && item.roles.includes(user.role)
-  );
+  const filteredItems = (user && navigationItemsByRole.get(user.role)) || [];
 
   return (
     <nav className="bg-white dark:bg-gray-900 shadow-lg border-b border-gray-200 dark:border-gray-700">
@@ -1,10 +1,18 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useApp } from '../../context/AppContext';
 import { FileText, Download, Calendar, Users, Filter } from 'lucide-react';
 import jsPDF from 'jspdf';
 import autoTable from "jspdf-autotable";
 import * as XLSX from 'xlsx';
 
+// The on-screen preview is windowed; PDF and Excel downloads still include every row
+const REPORT_PAGE_SIZE = 50;
+
+// Compiled once at load rather than on every header cell of every export
+const WORD_START_RE = /\b\w/g;
+const CAMEL_BOUNDARY_RE = /([A-Z])/g;
+const FIRST_CHAR_RE = /^./;
+
 const ReportsSection: React.FC = () => {
   const { classes, students, attendanceRecords, faculty } = useApp();
   const [reportType, setReportType] = useState('attendance');
@@ -15,15 +23,18 @@ const ReportsSection: React.FC = () => {
   });
   const [reportData, setReportData] = useState<any[]>([]);
   const [showReport, setShowReport] = useState(false);
+  const [reportPage, setReportPage] = useState(0);
 
   // Mock attendance data for demonstration
+  const today = new Date().toISOString().split('T')[0];
+  const yesterday = new Date(Date.now() - 86400000).toISOString().split('T')[0];
   const mockAttendanceRecords = [
     {
       id: '1',
       studentId: '3',
       classId: 'CS101',
       sessionId: 'session_1',
-      date: new Date().toISOString().split('T')[0],
+      date: today,
       time: '10:30 AM',
       status: 'present' as const,
       method: 'qr' as const
@@ -33,7 +44,7 @@ const ReportsSection: React.FC = () => {
       studentId: '4',
       classId: 'CS101',
       sessionId: 'session_1',
-      date: new Date().toISOString().split('T')[0],
+      date: today,
       time: '10:32 AM',
       status: 'late' as const,
       method: 'face' as const
@@ -43,7 +54,7 @@ const ReportsSection: React.FC = () => {
       studentId: '3',
       classId: 'CS201',
       sessionId: 'session_2',
-      date: new Date(Date.now() - 86400000).toISOString().split('T')[0],
+      date: yesterday,
       time: '2:00 PM',
       status: 'present' as const,
       method: 'qr' as const
@@ -52,24 +63,26 @@ const ReportsSection: React.FC = () => {
 
   const allRecords = attendanceRecords.length > 0 ? attendanceRecords : mockAttendanceRecords;
 
+  // Index students and classes once so each record resolves in O(1)
+  const studentsById = useMemo(() => new Map(students.map(s => [s.id, s])), [students]);
+  const classesById = useMemo(() => new Map(classes.map(c => [c.id, c])), [classes]);
+
   const generateReport = () => {
     let filteredData = [];
 
     switch (reportType) {
-      case 'attendance':
+      case 'attendance': {
+        // Record dates and the range inputs are both YYYY-MM-DD, so they order correctly as strings
+        const startDate = dateRange.start;
+        const endDate = dateRange.end;
+
         filteredData = allRecords.filter(record => {
-          const matchesClass = !selectedClass || record.classId === selectedClass;
-          const recordDate = new Date(record.date);
-          const startDate = dateRange.start ? new Date(dateRange.start) : null;
-          const endDate = dateRange.end ? new Date(dateRange.end) : null;
-          
-          const matchesDate = (!startDate || recordDate >= startDate) && 
-                             (!endDate || recordDate <= endDate);
-          
-          return matchesClass && matchesDate;
+          if (selectedClass && record.classId !== selectedClass) return false;
+          return (!startDate || record.date >= startDate) &&
+                 (!endDate || record.date <= endDate);
         }).map(record => {
-          const student = students.find(s => s.id === record.studentId);
-          const classInfo = classes.find(c => c.id === record.classId);
+          const student = studentsById.get(record.studentId);
+          const classInfo = classesById.get(record.classId);
           
           return {
             studentName: student?.name || 'Unknown',
@@ -82,14 +95,27 @@ const ReportsSection: React.FC = () => {
           };
         });
         break;
+      }
+
+      case 'class_summary': {
+        // Tally sessions and statuses for every class in a single pass over the records
+        const classTallies = new Map<string, { sessions: Set<string>; present: number; absent: number; late: number }>();
+        for (const record of allRecords) {
+          let tally = classTallies.get(record.classId);
+          if (!tally) {
+            tally = { sessions: new Set(), present: 0, absent: 0, late: 0 };
+            classTallies.set(record.classId, tally);
+          }
+          tally.sessions.add(record.sessionId);
+          tally[record.status]++;
+        }
 
-      case 'class_summary':
         const classSummary = classes.map(cls => {
-          const classRecords = allRecords.filter(r => r.classId === cls.id);
-          const totalSessions = new Set(classRecords.map(r => r.sessionId)).size;
-          const presentCount = classRecords.filter(r => r.status === 'present').length;
-          const absentCount = classRecords.filter(r => r.status === 'absent').length;
-          const lateCount = classRecords.filter(r => r.status === 'late').length;
+          const tally = classTallies.get(cls.id);
+          const totalSessions = tally ? tally.sessions.size : 0;
+          const presentCount = tally ? tally.present : 0;
+          const absentCount = tally ? tally.absent : 0;
+          const lateCount = tally ? tally.late : 0;
           
           return {
             className: cls.name,
@@ -104,14 +130,27 @@ const ReportsSection: React.FC = () => {
         });
         filteredData = classSummary;
         break;
+      }
+
+      case 'student_summary': {
+        // Tally statuses for every student in a single pass over the records
+        const studentTallies = new Map<string, { total: number; present: number; absent: number; late: number }>();
+        for (const record of allRecords) {
+          let tally = studentTallies.get(record.studentId);
+          if (!tally) {
+            tally = { total: 0, present: 0, absent: 0, late: 0 };
+            studentTallies.set(record.studentId, tally);
+          }
+          tally.total++;
+          tally[record.status]++;
+        }
 
-      case 'student_summary':
         const studentSummary = students.map(student => {
-          const studentRecords = allRecords.filter(r => r.studentId === student.id);
-          const presentCount = studentRecords.filter(r => r.status === 'present').length;
-          const absentCount = studentRecords.filter(r => r.status === 'absent').length;
-          const lateCount = studentRecords.filter(r => r.status === 'late').length;
-          const totalSessions = studentRecords.length;
+          const tally = studentTallies.get(student.id);
+          const presentCount = tally ? tally.present : 0;
+          const absentCount = tally ? tally.absent : 0;
+          const lateCount = tally ? tally.late : 0;
+          const totalSessions = tally ? tally.total : 0;
           
           return {
             studentName: student.name,
@@ -125,36 +164,39 @@ const ReportsSection: React.FC = () => {
         });
         filteredData = studentSummary;
         break;
+      }
     }
 
     setReportData(filteredData);
+    setReportPage(0);
     setShowReport(true);
   };
 
+  const pageCount = Math.ceil(reportData.length / REPORT_PAGE_SIZE);
+  const pageStart = reportPage * REPORT_PAGE_SIZE;
+  const pageRows = reportData.slice(pageStart, pageStart + REPORT_PAGE_SIZE);
+
   const downloadPDF = () => {
-  const doc = new jsPDF();
+    if (reportData.length === 0) return;
 
-  doc.setFontSize(18);
-  doc.text("Attendance Report", 14, 20);
+    const doc = new jsPDF();
+    const columns = Object.keys(reportData[0]);
 
-  // Convert your React table to PDF
-  (doc as any).autoTable({
-    head: [["Student Name", "Roll No", "Class", "Attendance (%)"]],
-    body: students.map((s) => [
-      s.name,
-      s.rollNumber,
-      s.className,
-      `${s.attendancePercentage}%`,
-    ]),
-    startY: 30,
-    theme: "grid",
-    styles: { fontSize: 10, cellPadding: 3 },
-    headStyles: { fillColor: [41, 128, 185] },
-  });
+    doc.setFontSize(18);
+    doc.text(`${reportType.replace('_', ' ').replace(WORD_START_RE, l => l.toUpperCase())} Report`, 14, 20);
 
-  doc.save("attendance-report.pdf");
-};
+    // autoTable lays the rows out page by page and repeats the header on each page
+    autoTable(doc, {
+      head: [columns.map(key => key.replace(CAMEL_BOUNDARY_RE, ' $1').replace(FIRST_CHAR_RE, l => l.toUpperCase()))],
+      body: reportData.map(row => columns.map(key => String(row[key] ?? ''))),
+      startY: 30,
+      theme: 'grid',
+      styles: { fontSize: 10, cellPadding: 3 },
+      headStyles: { fillColor: [41, 128, 185] },
+    });
 
+    doc.save(`${reportType}_report_${new Date().toISOString().split('T')[0]}.pdf`);
+  };
 
   const downloadExcel = () => {
     const ws = XLSX.utils.json_to_sheet(reportData);
@@ -351,8 +393,8 @@ const ReportsSection: React.FC = () => {
                 </tr>
               </thead>
               <tbody className="bg-white dark:bg-gray-800 divide-y divide-gray-200 dark:divide-gray-700">
-                {reportData.map((row, index) => (
-                  <tr key={index} className="hover:bg-gray-50 dark:hover:bg-gray-700">
+                {pageRows.map((row, index) => (
+                  <tr key={pageStart + index} className="hover:bg-gray-50 dark:hover:bg-gray-700">
                     {reportType === 'attendance' && (
                       <>
                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-900 dark:text-white">
@@ -446,6 +488,30 @@ const ReportsSection: React.FC = () => {
               </tbody>
             </table>
           </div>
+
+          {pageCount > 1 && (
+            <div className="flex justify-between items-center mt-4 text-sm text-gray-600 dark:text-gray-400">
+              <span>
+                Showing {pageStart + 1}-{pageStart + pageRows.length} of {reportData.length}
+              </span>
+              <div className="flex space-x-2">
+                <button
+                  onClick={() => setReportPage(reportPage - 1)}
+                  disabled={reportPage === 0}
+                  className="px-3 py-1 border border-gray-300 dark:border-gray-600 rounded-md disabled:opacity-50 hover:bg-gray-50 dark:hover:bg-gray-700"
+                >
+                  Previous
+                </button>
+                <button
+                  onClick={() => setReportPage(reportPage + 1)}
+                  disabled={reportPage >= pageCount - 1}
+                  className="px-3 py-1 border border-gray-300 dark:border-gray-600 rounded-md disabled:opacity-50 hover:bg-gray-50 dark:hover:bg-gray-700"
+                >
+                  Next
+                </button>
+              </div>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -1,10 +1,13 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useAuth } from '../../context/AuthContext';
 import { useApp } from '../../context/AppContext';
 import { Plus, Edit, Trash2, User, Mail, BookOpen, TrendingUp, Upload, Download } from 'lucide-react';
 import * as XLSX from 'xlsx';
 import Papa from 'papaparse';
 
+// Render the student grid a page at a time so large rosters don't mount every card up front
+const STUDENT_PAGE_SIZE = 24;
+
 const StudentsSection: React.FC = () => {
   const { user } = useAuth();
   const { students, setStudents, classes } = useApp();
@@ -14,6 +17,7 @@ const StudentsSection: React.FC = () => {
   const [showImportModal, setShowImportModal] = useState(false);
   const [selectedStudent, setSelectedStudent] = useState<any>(null);
   const [searchTerm, setSearchTerm] = useState('');
+  const [visibleCount, setVisibleCount] = useState(STUDENT_PAGE_SIZE);
   const [formData, setFormData] = useState({
     name: '',
     email: '',
@@ -21,8 +25,14 @@ const StudentsSection: React.FC = () => {
     classIds: []
   });
 
+  // Resolve the admin permission once instead of re-checking in every handler and card
+  const isAdmin = user?.role === 'admin';
+
+  // Index classes once so profile and export lookups don't rescan the list
+  const classesById = useMemo(() => new Map(classes.map(cls => [cls.id, cls])), [classes]);
+
   const handleAddStudent = () => {
-    if (user?.role === 'admin') {
+    if (isAdmin) {
       const newStudent = {
         id: `STU${Date.now()}`,
         ...formData,
@@ -37,7 +47,7 @@ const StudentsSection: React.FC = () => {
   };
 
   const handleEditStudent = () => {
-    if (selectedStudent && user?.role === 'admin') {
+    if (selectedStudent && isAdmin) {
       const updatedStudents = students.map(student => 
         student.id === selectedStudent.id 
           ? { ...student, ...formData }
@@ -51,7 +61,7 @@ const StudentsSection: React.FC = () => {
   };
 
   const handleDeleteStudent = (studentId: string) => {
-    if (user?.role === 'admin') {
+    if (isAdmin) {
       const updatedStudents = students.filter(student => student.id !== studentId);
       setStudents(updatedStudents);
     }
@@ -80,14 +90,19 @@ const StudentsSection: React.FC = () => {
     Papa.parse(file, {
       complete: (result) => {
         const csvData = result.data as any[];
-        const headers = csvData[0];
+        // skipEmptyLines leaves no header row for an empty file
+        if (csvData.length === 0) return;
+
+        // Normalise the header keys once rather than for every row
+        const keys = (csvData[0] as string[]).map(header => header.toLowerCase().replace(' ', ''));
+        const batchId = Date.now();
         const newStudents = csvData.slice(1).map((row: any[], index: number) => {
           const studentData: any = {};
-          headers.forEach((header: string, headerIndex: number) => {
-            studentData[header.toLowerCase().replace(' ', '')] = row[headerIndex];
+          keys.forEach((key, keyIndex) => {
+            studentData[key] = row[keyIndex];
           });
           return {
-            id: `CSV${Date.now()}${index}`,
+            id: `CSV${batchId}${index}`,
             name: studentData.name || '',
             email: studentData.email || '',
             studentId: studentData.studentid || studentData.id || '',
@@ -111,7 +126,7 @@ const StudentsSection: React.FC = () => {
       'Student ID': student.studentId,
       'Name': student.name,
       'Email': student.email,
-      'Classes': student.classIds.map(id => classes.find(c => c.id === id)?.name || id).join(', '),
+      'Classes': student.classIds.map(id => classesById.get(id)?.name || id).join(', '),
       'Total Attendance': student.totalAttendance,
       'Attendance Percentage': student.attendancePercentage + '%'
     }));
@@ -122,18 +137,24 @@ const StudentsSection: React.FC = () => {
     XLSX.writeFile(wb, `students_${new Date().toISOString().split('T')[0]}.xlsx`);
   };
 
-  const filteredStudents = students.filter(student =>
-    student.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    student.email.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    student.studentId.toLowerCase().includes(searchTerm.toLowerCase())
-  );
+  // Lowercase the searchable fields once per roster change rather than on every keystroke
+  const studentSearchIndex = useMemo(() => students.map(student => ({
+    student,
+    haystack: `${student.name}\n${student.email}\n${student.studentId}`.toLowerCase()
+  })), [students]);
+
+  const filteredStudents = useMemo(() => {
+    const term = searchTerm.toLowerCase();
+    if (!term) return students;
+    return studentSearchIndex.filter(entry => entry.haystack.includes(term)).map(entry => entry.student);
+  }, [students, studentSearchIndex, searchTerm]);
 
   return (
     <div className="space-y-6">
       <div className="flex justify-between items-center">
         <h2 className="text-2xl font-bold text-gray-900 dark:text-white">Students</h2>
         <div className="flex space-x-2">
-          {user?.role === 'admin' && (
+          {isAdmin && (
             <>
               <button
                 onClick={() => setShowImportModal(true)}
@@ -166,13 +187,16 @@ const StudentsSection: React.FC = () => {
           type="text"
           placeholder="Search students..."
           value={searchTerm}
-          onChange={(e) => setSearchTerm(e.target.value)}
+          onChange={(e) => {
+            setSearchTerm(e.target.value);
+            setVisibleCount(STUDENT_PAGE_SIZE);
+          }}
           className="w-full px-4 py-2 border border-gray-300 dark:border-gray-600 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 dark:bg-gray-700 dark:text-white"
         />
       </div>
 
       <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-        {filteredStudents.map((student) => (
+        {filteredStudents.slice(0, visibleCount).map((student) => (
           <div key={student.id} className="bg-white dark:bg-gray-800 rounded-lg shadow-md p-6">
             <div className="flex justify-between items-start mb-4">
               <div className="flex items-center">
@@ -186,7 +210,7 @@ const StudentsSection: React.FC = () => {
                   </p>
                 </div>
               </div>
-              {user?.role === 'admin' && (
+              {isAdmin && (
                 <div className="flex space-x-2">
                   <button
                     onClick={() => openEditModal(student)}
@@ -238,6 +262,17 @@ const StudentsSection: React.FC = () => {
         ))}
       </div>
 
+      {filteredStudents.length > visibleCount && (
+        <div className="flex justify-center">
+          <button
+            onClick={() => setVisibleCount(visibleCount + STUDENT_PAGE_SIZE)}
+            className="px-4 py-2 border border-gray-300 dark:border-gray-600 text-gray-700 dark:text-gray-300 rounded-md hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors duration-200"
+          >
+            Load more ({filteredStudents.length - visibleCount} remaining)
+          </button>
+        </div>
+      )}
+
       {/* Add Student Modal */}
       {showAddModal && (
         <div className="fixed inset-0 bg-black bg-opacity-50 flex items-center justify-center z-50">
@@ -380,7 +415,7 @@ const StudentsSection: React.FC = () => {
                 <h4 className="font-medium text-gray-900 dark:text-white mb-3">Enrolled Classes</h4>
                 <div className="space-y-2">
                   {selectedStudent.classIds.map((classId: string) => {
-                    const classInfo = classes.find(c => c.id === classId);
+                    const classInfo = classesById.get(classId);
                     return (
                       <div key={classId} className="p-2 bg-gray-50 dark:bg-gray-700 rounded">
                         <p className="font-medium">{classInfo?.name || 'Unknown Class'}</p>
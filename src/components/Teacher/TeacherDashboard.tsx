@@ -1,8 +1,9 @@
-import React, { useState, useRef, useEffect } from 'react';
+import React, { useState, useRef, useEffect, useMemo } from 'react';
 import { useAuth } from '../../context/AuthContext';
 import { useApp } from '../../context/AppContext';
 import { glassmorphismStyles } from '../../styles/glassmorphism';
-import QRCode from 'qrcode';
+import { formatDateTime, formatTime } from '../../utils/dateFormat';
+import { renderQRCode } from '../../utils/qrCode';
 import {
   QrCodeIcon,
   CameraIcon,
@@ -30,11 +31,16 @@ interface AttendanceSession {
   method: 'qr' | 'face';
 }
 
+// Quote a CSV field only when it contains a delimiter, quote or newline
+const CSV_SPECIAL_RE = /[",\n]/;
+const CSV_QUOTE_RE = /"/g;
+const csvField = (value: string) => CSV_SPECIAL_RE.test(value) ? `"${value.replace(CSV_QUOTE_RE, '""')}"` : value;
+
 const TeacherDashboard: React.FC = () => {
   const { user } = useAuth();
   const { classes, students, attendanceRecords, setAttendanceRecords } = useApp();
   const [activeSession, setActiveSession] = useState<AttendanceSession | null>(null);
-  const [qrCodeUrl, setQrCodeUrl] = useState('');
+  const [qrPayload, setQrPayload] = useState('');
   const [selectedClass, setSelectedClass] = useState('');
   const [attendanceMethod, setAttendanceMethod] = useState<'qr' | 'face'>('qr');
   const [isSessionActive, setIsSessionActive] = useState(false);
@@ -43,6 +49,20 @@ const TeacherDashboard: React.FC = () => {
 
   const qrCanvasRef = useRef<HTMLCanvasElement>(null);
 
+  // Group records by class in one pass; session polling, exports and the class overview all read from it
+  const recordsByClass = useMemo(() => {
+    const index = new Map<string, typeof attendanceRecords>();
+    for (const record of attendanceRecords) {
+      const classRecords = index.get(record.classId);
+      if (classRecords) {
+        classRecords.push(record);
+      } else {
+        index.set(record.classId, [record]);
+      }
+    }
+    return index;
+  }, [attendanceRecords]);
+
   useEffect(() => {
     if (activeSession && isSessionActive) {
       // Update real-time attendance every 5 seconds
@@ -54,29 +74,23 @@ const TeacherDashboard: React.FC = () => {
     }
   }, [activeSession, isSessionActive]);
 
-  const generateQRCode = async (classId: string) => {
-    try {
-      const qrData = {
-        classId,
-        type: 'attendance',
-        timestamp: new Date().toISOString(),
-        teacherId: user?.id
-      };
-
-      const qrCodeDataURL = await QRCode.toDataURL(JSON.stringify(qrData), {
-        width: 300,
-        margin: 2,
-        color: {
-          dark: '#000000',
-          light: '#FFFFFF'
-        }
-      });
-
-      setQrCodeUrl(qrCodeDataURL);
-      setShowQRCode(true);
-    } catch (error) {
-      console.error('Error generating QR code:', error);
+  useEffect(() => {
+    // Draw straight onto the canvas instead of round-tripping through a base64 PNG data URL
+    if (showQRCode && qrPayload && qrCanvasRef.current) {
+      renderQRCode(qrCanvasRef.current, qrPayload, 300);
     }
+  }, [qrPayload, showQRCode]);
+
+  const generateQRCode = (classId: string, timestamp: string) => {
+    const qrData = {
+      classId,
+      type: 'attendance',
+      timestamp,
+      teacherId: user?.id
+    };
+
+    setQrPayload(JSON.stringify(qrData));
+    setShowQRCode(true);
   };
 
   const startAttendanceSession = () => {
@@ -85,11 +99,15 @@ const TeacherDashboard: React.FC = () => {
     const selectedClassData = classes.find(c => c.id === selectedClass);
     if (!selectedClassData) return;
 
+    // One clock read shared by the session id, its start time and the QR payload
+    const now = new Date();
+    const startTime = now.toISOString();
+
     const session: AttendanceSession = {
-      id: Date.now().toString(),
+      id: now.getTime().toString(),
       classId: selectedClass,
       className: selectedClassData.name,
-      startTime: new Date().toISOString(),
+      startTime,
       isActive: true,
       attendanceCount: 0,
       totalStudents: selectedClassData.studentIds.length,
@@ -100,7 +118,7 @@ const TeacherDashboard: React.FC = () => {
     setIsSessionActive(true);
 
     if (attendanceMethod === 'qr') {
-      generateQRCode(selectedClass);
+      generateQRCode(selectedClass, startTime);
     }
   };
 
@@ -115,9 +133,10 @@ const TeacherDashboard: React.FC = () => {
   const updateRealTimeAttendance = () => {
     if (!activeSession) return;
 
-    const sessionAttendance = attendanceRecords.filter(record => 
-      record.classId === activeSession.classId &&
-      new Date(record.timestamp) >= new Date(activeSession.startTime)
+    // Both sides are toISOString() output, so string order is time order and nothing needs parsing
+    const sessionStart = activeSession.startTime;
+    const sessionAttendance = (recordsByClass.get(activeSession.classId) || []).filter(record =>
+      record.timestamp >= sessionStart
     );
 
     setRealTimeAttendance(sessionAttendance);
@@ -133,24 +152,23 @@ const TeacherDashboard: React.FC = () => {
   const downloadAttendanceReport = () => {
     if (!activeSession) return;
 
-    const sessionAttendance = attendanceRecords.filter(record => 
-      record.classId === activeSession.classId &&
-      new Date(record.timestamp) >= new Date(activeSession.startTime)
-    );
+    const sessionStart = activeSession.startTime;
 
-    const csvContent = [
-      ['Student ID', 'Student Name', 'Method', 'Confidence', 'Timestamp', 'Photo'],
-      ...sessionAttendance.map(record => [
+    // Hand each row to the Blob as its own part instead of joining one large string
+    const csvParts = ['Student ID,Student Name,Method,Confidence,Timestamp,Photo\n'];
+    for (const record of recordsByClass.get(activeSession.classId) || []) {
+      if (record.timestamp < sessionStart) continue;
+      csvParts.push([
         record.studentId,
         record.studentName,
         record.method,
         record.confidence.toString(),
-        new Date(record.timestamp).toLocaleString(),
+        formatDateTime(record.timestamp),
         record.photo ? 'Yes' : 'No'
-      ])
-    ].map(row => row.join(',')).join('\n');
+      ].map(csvField).join(',') + '\n');
+    }
 
-    const blob = new Blob([csvContent], { type: 'text/csv' });
+    const blob = new Blob(csvParts, { type: 'text/csv' });
     const url = window.URL.createObjectURL(blob);
     const a = document.createElement('a');
     a.href = url;
@@ -337,14 +355,14 @@ const TeacherDashboard: React.FC = () => {
         )}
 
         {/* QR Code Display */}
-        {showQRCode && qrCodeUrl && (
+        {showQRCode && qrPayload && (
           <div className={`${glassmorphismStyles.card.base} ${glassmorphismStyles.card.hover} p-6`}>
             <h2 className="text-xl font-bold text-gray-800 dark:text-gray-100 mb-4">
               QR Code for Attendance
             </h2>
             <div className="text-center">
               <div className="inline-block p-4 bg-white rounded-2xl shadow-lg">
-                <img src={qrCodeUrl} alt="Attendance QR Code" className="w-64 h-64" />
+                <canvas ref={qrCanvasRef} aria-label="Attendance QR Code" className="w-64 h-64" />
               </div>
               <p className="text-sm text-gray-600 dark:text-gray-300 mt-4">
                 Students should scan this QR code to mark their attendance
@@ -385,7 +403,7 @@ const TeacherDashboard: React.FC = () => {
                           {record.studentName}
                         </p>
                         <p className="text-sm text-gray-600 dark:text-gray-300">
-                          {new Date(record.timestamp).toLocaleString()}
+                          {formatDateTime(record.timestamp)}
                         </p>
                       </div>
                     </div>
@@ -412,9 +430,9 @@ const TeacherDashboard: React.FC = () => {
             </h3>
             <div className="space-y-3">
               {classes.map((cls) => {
-                const classAttendance = attendanceRecords.filter(record => record.classId === cls.id);
+                const classAttendanceCount = recordsByClass.get(cls.id)?.length || 0;
                 const attendanceRate = cls.studentIds.length > 0 
-                  ? (classAttendance.length / cls.studentIds.length) * 100 
+                  ? (classAttendanceCount / cls.studentIds.length) * 100 
                   : 0;
 
                 return (
@@ -432,7 +450,7 @@ const TeacherDashboard: React.FC = () => {
                         {attendanceRate.toFixed(1)}%
                       </p>
                       <p className="text-xs text-gray-500 dark:text-gray-400">
-                        {classAttendance.length}/{cls.studentIds.length}
+                        {classAttendanceCount}/{cls.studentIds.length}
                       </p>
                     </div>
                   </div>
@@ -464,7 +482,7 @@ const TeacherDashboard: React.FC = () => {
                       {record.studentName}
                     </p>
                     <p className="text-xs text-gray-600 dark:text-gray-300">
-                      {record.classId} • {new Date(record.timestamp).toLocaleTimeString()}
+                      {record.classId} • {formatTime(record.timestamp)}
                     </p>
                   </div>
                 </div>
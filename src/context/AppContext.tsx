@@ -1,4 +1,4 @@
-import React, { createContext, useContext, useState, useEffect, ReactNode } from 'react';
+import React, { createContext, useContext, useState, useEffect, useCallback, useMemo, ReactNode } from 'react';
 import { Class, Student, Faculty, AttendanceSession, AttendanceRecord } from '../types';
 
 interface AppContextType {
@@ -81,6 +81,15 @@ const mockFaculty: Faculty[] = [
   }
 ];
 
+// Theme palette used for the CSS custom properties
+const themeColors = {
+  blue: { primary: '#3B82F6', secondary: '#1E40AF', accent: '#60A5FA' },
+  purple: { primary: '#8B5CF6', secondary: '#7C3AED', accent: '#A78BFA' },
+  green: { primary: '#10B981', secondary: '#059669', accent: '#34D399' },
+  orange: { primary: '#F59E0B', secondary: '#D97706', accent: '#FBBF24' },
+  pink: { primary: '#EC4899', secondary: '#DB2777', accent: '#F472B6' }
+};
+
 export const AppProvider: React.FC<{ children: ReactNode }> = ({ children }) => {
   const [classes, setClasses] = useState<Class[]>(mockClasses);
   const [students, setStudents] = useState<Student[]>(mockStudents);
@@ -97,31 +106,23 @@ export const AppProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     return (saved as any) || 'blue';
   });
 
-  const toggleDarkMode = () => {
+  const toggleDarkMode = useCallback(() => {
     const newMode = !darkMode;
     setDarkMode(newMode);
     localStorage.setItem('attendify_dark_mode', JSON.stringify(newMode));
     document.documentElement.classList.toggle('dark', newMode);
-  };
+  }, [darkMode]);
 
-  const setColorTheme = (theme: 'blue' | 'purple' | 'green' | 'orange' | 'pink') => {
+  const setColorTheme = useCallback((theme: 'blue' | 'purple' | 'green' | 'orange' | 'pink') => {
     setColorThemeState(theme);
     localStorage.setItem('attendify_color_theme', theme);
     // Update CSS custom properties for theme colors
     const root = document.documentElement;
-    const themeColors = {
-      blue: { primary: '#3B82F6', secondary: '#1E40AF', accent: '#60A5FA' },
-      purple: { primary: '#8B5CF6', secondary: '#7C3AED', accent: '#A78BFA' },
-      green: { primary: '#10B981', secondary: '#059669', accent: '#34D399' },
-      orange: { primary: '#F59E0B', secondary: '#D97706', accent: '#FBBF24' },
-      pink: { primary: '#EC4899', secondary: '#DB2777', accent: '#F472B6' }
-    };
-    
     const colors = themeColors[theme];
     root.style.setProperty('--color-primary', colors.primary);
     root.style.setProperty('--color-secondary', colors.secondary);
     root.style.setProperty('--color-accent', colors.accent);
-  };
+  }, []);
 
   // ✅ useEffect is now inside AppProvider
   useEffect(() => {
@@ -131,25 +132,39 @@ export const AppProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     setColorTheme(colorTheme);
   }, []);
 
+  // Rebuild the context value only when one of its fields changes
+  const value = useMemo(() => ({
+    classes,
+    students,
+    faculty,
+    attendanceSessions,
+    attendanceRecords,
+    activeSession,
+    darkMode,
+    colorTheme,
+    setClasses,
+    setStudents,
+    setFaculty,
+    setAttendanceSessions,
+    setAttendanceRecords,
+    setActiveSession,
+    toggleDarkMode,
+    setColorTheme
+  }), [
+    classes,
+    students,
+    faculty,
+    attendanceSessions,
+    attendanceRecords,
+    activeSession,
+    darkMode,
+    colorTheme,
+    toggleDarkMode,
+    setColorTheme
+  ]);
+
   return (
-    <AppContext.Provider value={{
-      classes,
-      students,
-      faculty,
-      attendanceSessions,
-      attendanceRecords,
-      activeSession,
-      darkMode,
-      colorTheme,
-      setClasses,
-      setStudents,
-      setFaculty,
-      setAttendanceSessions,
-      setAttendanceRecords,
-      setActiveSession,
-      toggleDarkMode,
-      setColorTheme
-    }}>
+    <AppContext.Provider value={value}>
       {children}
     </AppContext.Provider>
   );
@@ -26,31 +26,33 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     if (savedUser && savedToken) {
       setUser(JSON.parse(savedUser));
       setToken(savedToken);
+      apiService.setToken(savedToken);
     }
     setIsLoading(false);
   }, []);
 
   const login = async (email: string, _password: string, role: string): Promise<boolean> => {
     setIsLoading(true);
-    console.log('🔐 Attempting login with:', { email, role });
+    if (import.meta.env.DEV) console.log('🔐 Attempting login with:', { email, role });
     
     try {
       // Use the mock API service
       const data = await apiService.login(email, role);
-      console.log('📥 Received response:', data);
+      if (import.meta.env.DEV) console.log('📥 Received response:', data);
 
       if (data.success) {
         const { user: userData, access_token } = data.data;
-        console.log('✅ Login successful, user data:', userData);
+        if (import.meta.env.DEV) console.log('✅ Login successful, user data:', userData);
         setUser(userData);
         setToken(access_token);
+        apiService.setToken(access_token);
         localStorage.setItem('attendify_user', JSON.stringify(userData));
         localStorage.setItem('attendify_token', access_token);
         setIsLoading(false);
         return true;
       }
       
-      console.log('❌ Login failed:', data);
+      if (import.meta.env.DEV) console.log('❌ Login failed:', data);
       setIsLoading(false);
       return false;
     } catch (error) {
@@ -83,6 +85,7 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
   const logout = () => {
     setUser(null);
     setToken(null);
+    apiService.setToken(null);
     localStorage.removeItem('attendify_user');
     localStorage.removeItem('attendify_token');
   };
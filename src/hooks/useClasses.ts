@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState } from 'react';
 import { apiService } from '../services/api';
 import { useAuth } from '../context/AuthContext';
 
@@ -6,13 +6,7 @@ export const useClasses = () => {
   const [classes, setClasses] = useState<any[]>([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const { user, token } = useAuth();
-
-  useEffect(() => {
-    if (token) {
-      apiService.setToken(token);
-    }
-  }, [token]);
+  const { user } = useAuth();
 
   const fetchActiveClasses = async () => {
     try {
@@ -10,7 +10,6 @@ export const useDashboard = () => {
 
   useEffect(() => {
     if (token) {
-      apiService.setToken(token);
       fetchDashboardData();
     }
   }, [token, user]);
@@ -19,9 +18,9 @@ export const useDashboard = () => {
     try {
       setLoading(true);
       setError(null);
-      console.log('🔍 Fetching dashboard data with token:', token ? 'Present' : 'Missing');
+      if (import.meta.env.DEV) console.log('🔍 Fetching dashboard data with token:', token ? 'Present' : 'Missing');
       const data = await apiService.getDashboardOverview();
-      console.log('📊 Dashboard data received:', data);
+      if (import.meta.env.DEV) console.log('📊 Dashboard data received:', data);
       setDashboardData(data.data);
     } catch (err: any) {
       console.error('💥 Dashboard fetch error:', err);
@@ -1,13 +1,55 @@
 // Mock API service - no backend needed
 const API_BASE_URL = 'mock://api';
+// How often dashboard widgets refresh
+export const DASHBOARD_POLL_MS = 30 * 1000;
+// Dashboard aggregates change slowly, so serve every other poll from memory. The TTL has to
+// outlast the poll interval; an equal TTL expires just before each poll arrives
+const DASHBOARD_TTL_MS = 2 * DASHBOARD_POLL_MS;
+
+const VALID_ROLES = new Set(['student', 'faculty', 'admin']);
+// 32 hex chars from one CSPRNG call; Math.random base36 slices are guessable and can come out
+// short. getRandomValues, unlike randomUUID, also works when served over plain HTTP on a LAN
+const randomToken = () =>
+  Array.from(crypto.getRandomValues(new Uint8Array(16)), byte => byte.toString(16).padStart(2, '0')).join('');
+
+const NAME_SEPARATOR_RE = /[._-]/g;
+const WORD_START_RE = /\b\w/g;
+
+// "jane.smith@x.com" -> "Jane Smith"; slices at the first '@' instead of splitting the whole address
+const nameFromEmail = (email: string) => {
+  const at = email.indexOf('@');
+  const local = at >= 0 ? email.slice(0, at) : email;
+  return local.replace(NAME_SEPARATOR_RE, ' ').replace(WORD_START_RE, l => l.toUpperCase());
+};
 
 class ApiService {
   private token: string | null = null;
+  private responseCache = new Map<string, { data: any; expiresAt: number }>();
 
   setToken(token: string | null) {
+    if (token !== this.token) {
+      this.invalidateCache();
+    }
     this.token = token;
   }
 
+  private invalidateCache() {
+    this.responseCache.clear();
+  }
+
+  // Return a fresh cached response for key, or build and remember a new one
+  private cached<T>(key: string, ttlMs: number, build: () => T): T {
+    const now = Date.now();
+    const entry = this.responseCache.get(key);
+    if (entry && entry.expiresAt > now) {
+      return entry.data;
+    }
+
+    const data = build();
+    this.responseCache.set(key, { data, expiresAt: now + ttlMs });
+    return data;
+  }
+
   private async request<T>(
     endpoint: string,
     options: RequestInit = {}
@@ -20,7 +62,7 @@ class ApiService {
   // Authentication
   async login(email: string, role: string) {
     // Mock login for now since backend is not working
-    const validRole = ['student', 'faculty', 'admin'].includes(role) ? role as 'student' | 'faculty' | 'admin' : 'student';
+    const validRole = VALID_ROLES.has(role) ? role as 'student' | 'faculty' | 'admin' : 'student';
     
     return Promise.resolve({
       success: true,
@@ -28,7 +70,7 @@ class ApiService {
         user: {
           id: '1',
           email: email,
-          name: email.split('@')[0].replace('.', ' ').replace('_', ' ').replace(/\b\w/g, l => l.toUpperCase()),
+          name: nameFromEmail(email),
           role: validRole
         },
         access_token: 'mock-token-' + Date.now(),
@@ -86,6 +128,7 @@ class ApiService {
 
   // Attendance
   async markAttendanceFace(classId: number, image: string) {
+    this.invalidateCache();
     return Promise.resolve({
       success: true,
       message: 'Attendance marked successfully (mock)',
@@ -97,6 +140,7 @@ class ApiService {
   }
 
   async markAttendanceQR(classId: number, qrToken: string) {
+    this.invalidateCache();
     return Promise.resolve({
       success: true,
       message: 'Attendance marked successfully (mock)',
@@ -177,6 +221,7 @@ class ApiService {
     qr_code_enabled?: boolean;
     attendance_window_minutes?: number;
   }) {
+    this.invalidateCache();
     return Promise.resolve({
       success: true,
       data: {
@@ -267,7 +312,7 @@ class ApiService {
       success: true,
       data: {
         qr_code: 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==',
-        qr_token: 'qr_' + Math.random().toString(36).substr(2, 9),
+        qr_token: 'qr_' + randomToken(),
         expires_at: new Date(Date.now() + 30 * 60 * 1000).toISOString()
       }
     });
@@ -330,7 +375,7 @@ class ApiService {
   }
 
   async getStudentDashboard(userId: number) {
-    return Promise.resolve({
+    return this.cached(`student-dashboard:${userId}`, DASHBOARD_TTL_MS, () => ({
       success: true,
       data: {
         user: {
@@ -357,11 +402,11 @@ class ApiService {
           }
         ]
       }
-    });
+    }));
   }
 
   async getFacultyDashboard(userId: number) {
-    return Promise.resolve({
+    return this.cached(`faculty-dashboard:${userId}`, DASHBOARD_TTL_MS, () => ({
       success: true,
       data: {
         user: {
@@ -384,11 +429,11 @@ class ApiService {
           average_attendance: 90.0
         }
       }
-    });
+    }));
   }
 
   async getAdminDashboard() {
-    return Promise.resolve({
+    return this.cached('admin-dashboard', DASHBOARD_TTL_MS, () => ({
       success: true,
       data: {
         overview: {
@@ -405,7 +450,7 @@ class ApiService {
           }
         ]
       }
-    });
+    }));
   }
 
   // Analytics
@@ -3,6 +3,10 @@ import * as faceapi from 'face-api.js';
 export class FaceRecognitionService {
   private modelsLoaded = false;
   private faceDescriptors: Map<string, Float32Array[]> = new Map();
+  // Every enrolled descriptor packed back to back, rebuilt lazily after enrollment changes
+  private descriptorMatrix: Float32Array | null = null;
+  private descriptorOwners: string[] = [];
+  private detectorOptions: Map<number, faceapi.TinyFaceDetectorOptions> = new Map();
 
   async loadModels() {
     if (this.modelsLoaded) return;
@@ -12,8 +16,7 @@ export class FaceRecognitionService {
       await Promise.all([
         faceapi.nets.tinyFaceDetector.loadFromUri('/models'),
         faceapi.nets.faceLandmark68Net.loadFromUri('/models'),
-        faceapi.nets.faceRecognitionNet.loadFromUri('/models'),
-        faceapi.nets.faceExpressionNet.loadFromUri('/models')
+        faceapi.nets.faceRecognitionNet.loadFromUri('/models')
       ]);
       
       this.modelsLoaded = true;
@@ -24,17 +27,23 @@ export class FaceRecognitionService {
     }
   }
 
-  async detectFaces(imageElement: HTMLImageElement | HTMLVideoElement | HTMLCanvasElement) {
+  // inputSize is the resolution the detector scales frames to; smaller sizes are cheaper but miss small faces
+  async detectFaces(imageElement: HTMLImageElement | HTMLVideoElement | HTMLCanvasElement, inputSize = 416) {
     if (!this.modelsLoaded) {
       await this.loadModels();
     }
 
+    let options = this.detectorOptions.get(inputSize);
+    if (!options) {
+      options = new faceapi.TinyFaceDetectorOptions({ inputSize });
+      this.detectorOptions.set(inputSize, options);
+    }
+
     try {
       const detections = await faceapi
-        .detectAllFaces(imageElement, new faceapi.TinyFaceDetectorOptions())
+        .detectAllFaces(imageElement, options)
         .withFaceLandmarks()
-        .withFaceDescriptors()
-        .withFaceExpressions();
+        .withFaceDescriptors();
 
       return detections;
     } catch (error) {
@@ -63,6 +72,7 @@ export class FaceRecognitionService {
       }
       
       this.faceDescriptors.get(userId)!.push(faceDescriptor);
+      this.descriptorMatrix = null;
       
       return {
         success: true,
@@ -75,43 +85,134 @@ export class FaceRecognitionService {
     }
   }
 
-  async recognizeFace(imageElement: HTMLImageElement | HTMLVideoElement | HTMLCanvasElement, threshold = 0.6) {
+  async enrollFaces(images: Array<HTMLImageElement | HTMLCanvasElement>, userId: string) {
     try {
-      const detections = await this.detectFaces(imageElement);
-      
-      if (detections.length === 0) {
-        return { recognized: false, confidence: 0, userId: null };
-      }
+      // Dispatch every frame together so the backend can queue their work back to back
+      const results = await Promise.all(images.map(image => this.detectFaces(image)));
 
-      const faceDescriptor = detections[0].descriptor;
-      let bestMatch = { userId: null, distance: Infinity };
-
-      // Compare with all enrolled faces
-      for (const [userId, descriptors] of this.faceDescriptors) {
-        for (const descriptor of descriptors) {
-          const distance = faceapi.euclideanDistance(faceDescriptor, descriptor);
-          if (distance < bestMatch.distance) {
-            bestMatch = { userId, distance };
-          }
+      // Skip frames without exactly one face instead of failing the whole batch
+      const descriptors: Float32Array[] = [];
+      for (const detections of results) {
+        if (detections.length === 1) {
+          descriptors.push(detections[0].descriptor);
         }
       }
 
-      const confidence = 1 - bestMatch.distance;
-      const recognized = confidence > threshold;
+      if (descriptors.length === 0) {
+        throw new Error('No face detected in the captured images');
+      }
+
+      // Store all descriptors for this user in a single update
+      this.faceDescriptors.set(userId, [...(this.faceDescriptors.get(userId) || []), ...descriptors]);
+      this.descriptorMatrix = null;
 
       return {
-        recognized,
-        confidence,
-        userId: recognized ? bestMatch.userId : null,
-        landmarks: detections[0].landmarks,
-        expressions: detections[0].expressions
+        success: true,
+        enrolledCount: descriptors.length
       };
+    } catch (error) {
+      console.error('Error enrolling faces:', error);
+      throw error;
+    }
+  }
+
+  async recognizeFace(imageElement: HTMLImageElement | HTMLVideoElement | HTMLCanvasElement, threshold = 0.6) {
+    try {
+      const detections = await this.detectFaces(imageElement);
+      
+      if (detections.length === 0) {
+        return { recognized: false, confidence: 0, userId: null };
+      }
+
+      return this.matchDetection(detections[0], threshold);
     } catch (error) {
       console.error('Error recognizing face:', error);
       throw error;
     }
   }
 
+  // Match an existing detection so callers that already ran detectFaces don't run the detector twice
+  matchDetection(detection: any, threshold = 0.6) {
+    const faceDescriptor = detection.descriptor;
+
+    // Compare with all enrolled faces in one scan over the packed matrix, taking the root only for the winner
+    const matrix = this.getDescriptorMatrix();
+    const size = faceDescriptor.length;
+    let bestRow = -1;
+    let bestSquared = Infinity;
+    const unrolled = size - (size % 4);
+    for (let row = 0; row < this.descriptorOwners.length; row++) {
+      const offset = row * size;
+      // Four independent accumulators keep the engine from serializing on one running sum
+      let s0 = 0, s1 = 0, s2 = 0, s3 = 0;
+      let i = 0;
+      for (; i < unrolled; i += 4) {
+        const d0 = matrix[offset + i] - faceDescriptor[i];
+        const d1 = matrix[offset + i + 1] - faceDescriptor[i + 1];
+        const d2 = matrix[offset + i + 2] - faceDescriptor[i + 2];
+        const d3 = matrix[offset + i + 3] - faceDescriptor[i + 3];
+        s0 += d0 * d0;
+        s1 += d1 * d1;
+        s2 += d2 * d2;
+        s3 += d3 * d3;
+        // Partial sums only grow, so stop as soon as this row can't beat the best match
+        if ((i & 31) === 28 && s0 + s1 + s2 + s3 >= bestSquared) break;
+      }
+      if (i < unrolled) continue;
+
+      let squared = s0 + s1 + s2 + s3;
+      for (; i < size; i++) {
+        const diff = matrix[offset + i] - faceDescriptor[i];
+        squared += diff * diff;
+      }
+      if (squared < bestSquared) {
+        bestSquared = squared;
+        bestRow = row;
+      }
+    }
+
+    const bestMatch = {
+      userId: bestRow >= 0 ? this.descriptorOwners[bestRow] : null,
+      distance: Math.sqrt(bestSquared)
+    };
+
+    const confidence = 1 - bestMatch.distance;
+    const recognized = confidence > threshold;
+
+    return {
+      recognized,
+      confidence,
+      userId: recognized ? bestMatch.userId : null,
+      landmarks: detection.landmarks
+    };
+  }
+
+  private getDescriptorMatrix() {
+    if (this.descriptorMatrix) return this.descriptorMatrix;
+
+    const owners: string[] = [];
+    let size = 0;
+    for (const [userId, descriptors] of this.faceDescriptors) {
+      for (const descriptor of descriptors) {
+        owners.push(userId);
+        size = descriptor.length;
+      }
+    }
+
+    const matrix = new Float32Array(owners.length * size);
+    let row = 0;
+    for (const descriptors of this.faceDescriptors.values()) {
+      for (const descriptor of descriptors) {
+        matrix.set(descriptor, row * size);
+        row++;
+      }
+    }
+
+    this.descriptorOwners = owners;
+    this.descriptorMatrix = matrix;
+    return matrix;
+  }
+
   async drawFaceDetections(canvas: HTMLCanvasElement, detections: any[]) {
     const ctx = canvas.getContext('2d');
     if (!ctx) return;
@@ -142,10 +243,12 @@ export class FaceRecognitionService {
 
   removeUserFace(userId: string) {
     this.faceDescriptors.delete(userId);
+    this.descriptorMatrix = null;
   }
 
   clearAllFaces() {
     this.faceDescriptors.clear();
+    this.descriptorMatrix = null;
   }
 }
 
@@ -0,0 +1,22 @@
+// toLocaleString() builds a new formatter on every call; lists and exports format
+// many timestamps, so share one formatter per style instead
+const dateTimeFormat = new Intl.DateTimeFormat(undefined, {
+  year: 'numeric',
+  month: 'numeric',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric'
+});
+
+const timeFormat = new Intl.DateTimeFormat(undefined, {
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric'
+});
+
+// Same output as new Date(timestamp).toLocaleString()
+export const formatDateTime = (timestamp: string) => dateTimeFormat.format(new Date(timestamp));
+
+// Same output as new Date(timestamp).toLocaleTimeString()
+export const formatTime = (timestamp: string) => timeFormat.format(new Date(timestamp));
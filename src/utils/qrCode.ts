@@ -0,0 +1,17 @@
+import QRCode from 'qrcode';
+
+// Shared by every attendance QR so they all render with the same options
+export const renderQRCode = (canvas: HTMLCanvasElement, data: string, size: number) => {
+  QRCode.toCanvas(canvas, data, {
+    width: size,
+    margin: 2,
+    color: {
+      dark: '#000000',
+      light: '#FFFFFF'
+    }
+  }, (error) => {
+    if (error) {
+      console.error('QR Code generation failed:', error);
+    }
+  });
+};
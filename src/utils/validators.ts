@@ -0,0 +1,6 @@
+// Form validation patterns, compiled once and shared by every auth form
+
+// Anchored so stray whitespace or extra text around the address doesn't pass
+export const EMAIL_RE = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+export const isValidEmail = (email: string) => EMAIL_RE.test(email);
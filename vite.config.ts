@@ -7,4 +7,17 @@ export default defineConfig({
   optimizeDeps: {
     exclude: ['lucide-react'],
   },
+  build: {
+    rollupOptions: {
+      output: {
+        // Keep the heavy libraries in their own long-lived chunks so app changes don't re-download them
+        manualChunks: {
+          'vendor-react': ['react', 'react-dom'],
+          'vendor-face': ['face-api.js'],
+          'vendor-export': ['xlsx', 'jspdf', 'jspdf-autotable', 'papaparse'],
+          'vendor-qr': ['qrcode', 'qr-scanner'],
+        },
+      },
+    },
+  },
 });